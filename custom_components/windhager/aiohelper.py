@@ -78,16 +78,14 @@ class DigestAuth:
         self.last_nonce = previous.get("last_nonce", "")
         self.nonce_count = previous.get("nonce_count", 0)
         self.challenge = previous.get("challenge")
-        self.args = {}
         self.session = session
 
     async def request(self, method, url, *, headers=None, **kwargs):
         if headers is None:
             headers = {}
 
-        # Save the args so we can re-run the request
-        self.args = {"method": method, "url": url, "headers": headers, "kwargs": kwargs}
-
+        # The challenge (nonce) is kept across requests, so once it is known
+        # every request is pre-authorized and skips the 401 round trip
         if self.challenge:
             headers[hdrs.AUTHORIZATION] = self._build_digest_header(method.upper(), url)
 
@@ -96,7 +94,7 @@ class DigestAuth:
         # Only try performing digest authentication if the response status is
         # from 400 to 500.
         if 400 <= response.status < 500:
-            return await self._handle_401(response)
+            return await self._handle_401(response, method, url, headers, kwargs)
 
         return response
 
@@ -183,9 +181,11 @@ class DigestAuth:
 
         return "Digest %s" % base
 
-    async def _handle_401(self, response):
+    async def _handle_401(self, response, method, url, headers, kwargs):
         """
         Takes the given response and tries digest-auth, if needed.
+        The original request args are passed in rather than stored on self,
+        so concurrent requests sharing this helper don't replay each other.
         :rtype: ClientResponse
         """
         auth_header = response.headers.get("www-authenticate", "")
@@ -194,11 +194,6 @@ class DigestAuth:
         if "digest" == parts[0].lower() and len(parts) > 1:
             self.challenge = parse_key_value_list(parts[1])
 
-            return await self.request(
-                self.args["method"],
-                self.args["url"],
-                headers=self.args["headers"],
-                **self.args["kwargs"],
-            )
+            return await self.request(method, url, headers=headers, **kwargs)
 
         return response
@@ -1,12 +1,65 @@
+import asyncio
 import aiohttp
+import functools
 import json
 import logging
 from pathlib import Path
 from .aiohelper import DigestAuth
-from .const import DEFAULT_USERNAME, DOMAIN
+from .const import DEFAULT_USERNAME, DOMAIN, MAX_CONCURRENT_LOOKUPS
+from .helpers import OIDMap, OIDView
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+# Marks a lookup response without a "value" key
+_MISSING = object()
+# Keeps the one-off bulk lookup probe well inside the coordinator's timeout
+_BULK_LOOKUP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Heating circuit child sensors: (oid key, name suffix, device type)
+_HK_SENSORS = (
+    ("room_temp", "Room Temperature", "temperature"),
+    ("room_target_ro", "Target Temperature (read-only)", "temperature"),
+    ("flow_temp", "Flow Temperature", "temperature"),
+    ("flow_target", "Flow Target", "temperature"),
+    ("dhw_temp", "DHW Temperature", "temperature"),
+    ("dhw_target_ro", "DHW Target (read-only)", "temperature"),
+    ("outside_temp", "Outside Temperature", "temperature"),
+    ("pump", "Pump", "sensor"),
+    ("mixer", "Mixer", "sensor"),
+)
+
+# Every heating circuit OID fetched on each tick: climate controls + child sensors
+_HK_OID_KEYS = (
+    "mode", "comfort_offset", "eco_temp", "eco_duration",
+) + tuple(key for key, _, _ in _HK_SENSORS)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_spec_cached(path: str, mtime: float) -> dict:
+    """Parse spec.json; cached per (path, mtime) so reloads skip re-parsing.
+
+    The returned dict is shared between clients and must not be mutated.
+    """
+    spec = _loads(Path(path).read_bytes())
+    # Precompute module sensor types once instead of on every topology build.
+    # Heuristic: label as temperature if name contains "temperatur"
+    for module in spec.get("modules", []):
+        for s in module.get("sensors", []):
+            s["_type"] = "temperature" if "temperatur" in s.get("name", "").lower() else "sensor"
+    _LOGGER.debug("Loaded spec.json from %s", path)
+    return spec
+
 
 class WindhagerHttpClient:
     """HTTP client for the RC7030 API, fully driven by spec.json."""
@@ -17,18 +70,25 @@ class WindhagerHttpClient:
 
         self._session = None
         self._auth = None
+        # Caps the number of in-flight lookups so the RC7030 is not flooded
+        self._lookup_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+        # None until probed; False once the RC7030 rejects bulk lookups
+        self._bulk_lookup_supported = None
 
         # Loaded on init from spec.json
         self._spec = self._load_spec()
-        self._unknown_values = set(self._spec.get("unknown_values", ["-.-", ""]))
+        self._unknown_values = frozenset(self._spec.get("unknown_values", ("-.-", "")))
         # Runtime-default Eco/Comfort duration (editable via service)
         self._eco_default_duration_minutes = int(
             self._spec.get("eco_default_duration_minutes", 180)
         )
 
-        # These are rebuilt on each fetch_all
-        self._oids_to_fetch = set()
+        # Topology is static for a given spec, so build it once up-front
+        self._oids_to_fetch = []
         self.devices = []
+        self._oids_ordered = ()
+        self._oid_index = {}
+        self._rebuild_topology()
 
     # ---------------------- Public properties ----------------------
 
@@ -54,10 +114,7 @@ class WindhagerHttpClient:
         """Load spec.json located next to this file."""
         try:
             path = Path(__file__).with_name("spec.json")
-            with path.open("r", encoding="utf-8") as f:
-                spec = json.load(f)
-            _LOGGER.debug("Loaded spec.json from %s", path)
-            return spec
+            return _load_spec_cached(str(path), path.stat().st_mtime)
         except Exception as e:
             _LOGGER.error("Failed to load spec.json: %s", e)
             # Fallback to empty spec so HA stays alive
@@ -65,10 +122,24 @@ class WindhagerHttpClient:
 
     async def _ensure_session(self):
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            # Pool and keep sockets alive across coordinator ticks so each lookup
+            # reuses a warm connection instead of a fresh TCP + Digest handshake
+            connector = aiohttp.TCPConnector(
+                limit=8,
+                limit_per_host=MAX_CONCURRENT_LOOKUPS,
+                keepalive_timeout=75,
+            )
+            timeout = aiohttp.ClientTimeout(total=15, connect=5)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={"Connection": "keep-alive"},
+                json_serialize=lambda obj: _dumps(obj).decode("utf-8"),
+            )
             self._auth = DigestAuth(DEFAULT_USERNAME, self.password, self._session)
 
     async def close(self):
+        # The session owns its connector, so closing it also releases the pool
         if self._session:
             await self._session.close()
             self._session = None
@@ -79,31 +150,103 @@ class WindhagerHttpClient:
         await self._ensure_session()
         url = f"http://{self.host}/api/1.0/lookup{oid}"
         try:
-            ret = await self._auth.request("GET", url)
-            js = await ret.json()
+            async with self._lookup_semaphore:
+                ret = await self._auth.request("GET", url)
+                # Decode the raw body ourselves to skip aiohttp's charset sniffing
+                js = _loads(await ret.read())
             _LOGGER.debug("Lookup %s -> %s", oid, js)
             return js
         except Exception as e:
             _LOGGER.error("Lookup failed for %s: %s", oid, e)
             return None
 
+    async def _bulk_lookup(self, oids) -> list | None:
+        """POST /api/1.0/lookup with all OIDs; None unless every OID comes back."""
+        ret = await self._auth.request(
+            "POST",
+            f"http://{self.host}/api/1.0/lookup",
+            headers={"Content-Type": "application/json"},
+            data=_dumps(list(oids)),
+            timeout=_BULK_LOOKUP_TIMEOUT,
+        )
+        if not 200 <= ret.status < 300:
+            ret.release()
+            return None
+        js = _loads(await ret.read())
+        if not isinstance(js, list):
+            return None
+
+        by_oid = {
+            item["OID"]: item
+            for item in js
+            if isinstance(item, dict) and "OID" in item and "value" in item
+        }
+        if any(oid not in by_oid for oid in oids):
+            return None
+        return [by_oid[oid] for oid in oids]
+
+    async def _lookup_many(self, oids) -> list:
+        """Look up all OIDs, in one bulk request when the RC7030 supports it."""
+        if not oids:
+            # Nothing to fetch (e.g. fallback spec); don't probe with an empty list
+            return []
+        if self._bulk_lookup_supported is not False:
+            try:
+                results = await self._bulk_lookup(oids)
+            except Exception as e:
+                _LOGGER.debug("Bulk lookup failed: %s", e)
+                results = None
+            if results is not None:
+                self._bulk_lookup_supported = True
+                return results
+            # Any error or incomplete answer disables the bulk endpoint for good,
+            # so a misbehaving controller never costs an extra POST per tick
+            _LOGGER.debug("Bulk lookup not supported, using per-OID lookups")
+            self._bulk_lookup_supported = False
+
+        return await asyncio.gather(
+            *(self.fetch(oid) for oid in oids), return_exceptions=True
+        )
+
     async def update(self, oid: str, value):
         """PUT /api/1.0/datapoint"""
         await self._ensure_session()
-        payload = bytes(f'{{"OID":"{oid}","value":"{value}"}}', "utf-8")
+        payload = _dumps({"OID": oid, "value": str(value)})
         try:
-            await self._auth.request("PUT", f"http://{self.host}/api/1.0/datapoint", data=payload)
+            await self._auth.request(
+                "PUT",
+                f"http://{self.host}/api/1.0/datapoint",
+                headers={"Content-Type": "application/json"},
+                data=payload,
+            )
             _LOGGER.debug("PUT %s = %s", oid, value)
         except Exception as e:
             _LOGGER.error("Failed to update %s: %s", oid, e)
             raise
 
-    @staticmethod
-    def slugify(identifier_str: str) -> str:
-        return identifier_str.replace(".", "-").replace("/", "-")
+    _SLUG_TRANS = str.maketrans({".": "-", "/": "-"})
+
+    @classmethod
+    def slugify(cls, identifier_str: str) -> str:
+        return identifier_str.translate(cls._SLUG_TRANS)
 
     # ---------------------- Device builders ----------------------
 
+    def _sensor_device(self, oid: str, name: str, typ: str, dev_id: str, device_name: str) -> dict:
+        """Build a child sensor entry for the device list."""
+        device = {
+            "id": self.slugify(f"{self.host}{oid}"),
+            "name": name,
+            "type": typ,
+            "oid": oid,
+            "device_id": dev_id,
+            "device_name": device_name,
+        }
+        if typ == "sensor":
+            # Status sensors carry no device/state class or unit
+            device.update(device_class=None, state_class=None, unit=None)
+        return device
+
     def _build_hk_climate_device(self, hk: dict):
         """Create a climate device (and child sensors) from a HK spec block."""
         name = hk["name"]
@@ -133,52 +276,16 @@ class WindhagerHttpClient:
             "device_name": name,
         })
 
-        # Register control/read OIDs
-        for k in ("mode", "comfort_offset", "eco_temp", "eco_duration", "room_temp", "room_target_ro"):
-            if oids.get(k):
-                self._oids_to_fetch.add(oids[k])
-
-        # Temperature child sensors
-        for key, nice in [
-            ("room_temp", f"{name} Room Temperature"),
-            ("room_target_ro", f"{name} Target Temperature (read-only)"),
-            ("flow_temp", f"{name} Flow Temperature"),
-            ("flow_target", f"{name} Flow Target"),
-            ("dhw_temp", f"{name} DHW Temperature"),
-            ("dhw_target_ro", f"{name} DHW Target (read-only)"),
-            ("outside_temp", f"{name} Outside Temperature"),
-        ]:
-            oid = oids.get(key)
-            if oid:
-                self.devices.append({
-                    "id": self.slugify(f"{self.host}{oid}"),
-                    "name": nice,
-                    "type": "temperature",
-                    "oid": oid,
-                    "device_id": dev_id,
-                    "device_name": name,
-                })
-                self._oids_to_fetch.add(oid)
-
-        # Status sensors (non-temperature)
-        for key, nice in [
-            ("pump", f"{name} Pump"),
-            ("mixer", f"{name} Mixer"),
-        ]:
+        # Temperature and status child sensors
+        for key, suffix, typ in _HK_SENSORS:
             oid = oids.get(key)
             if oid:
-                self.devices.append({
-                    "id": self.slugify(f"{self.host}{oid}"),
-                    "name": nice,
-                    "type": "sensor",
-                    "device_class": None,
-                    "state_class": None,
-                    "unit": None,
-                    "oid": oid,
-                    "device_id": dev_id,
-                    "device_name": name,
-                })
-                self._oids_to_fetch.add(oid)
+                self.devices.append(
+                    self._sensor_device(oid, f"{name} {suffix}", typ, dev_id, name)
+                )
+
+        # Register control/read OIDs and child sensor OIDs
+        self._oids_to_fetch.extend(filter(None, (oids.get(k) for k in _HK_OID_KEYS)))
 
     def _build_module_sensors(self, module: dict):
         """Create a non-climate device (AeroWIN / LogWIN / Hybrid) with read-only sensors."""
@@ -188,28 +295,24 @@ class WindhagerHttpClient:
         prefix = f"/1/{node}/{fct}"
         dev_id = self.slugify(f"{self.host}{prefix}")
 
+        oids = []
         for s in module.get("sensors", []):
-            oid = s["oid"]
-            s_name = s["name"]
-            # Heuristic: label as temperature if name contains "temperatur"
-            typ = "temperature" if "temperatur" in s_name.lower() else "sensor"
-            self.devices.append({
-                "id": self.slugify(f"{self.host}{oid}"),
-                "name": f"{name} {s_name}",
-                "type": typ,
-                "oid": oid,
-                "device_id": dev_id,
-                "device_name": name,
-            })
-            self._oids_to_fetch.add(oid)
+            oid = s.get("oid")
+            s_name = s.get("name")
+            if not oid or not s_name:
+                _LOGGER.warning("Skipping malformed sensor in module %s: %s", name, s)
+                continue
+            self.devices.append(
+                self._sensor_device(oid, f"{name} {s_name}", s["_type"], dev_id, name)
+            )
+            oids.append(oid)
 
-    # ---------------------- Main entry for coordinator ----------------------
+        self._oids_to_fetch.extend(oids)
 
-    async def fetch_all(self):
-        """Build device list from spec.json and fetch all referenced OIDs once."""
-        # Reset per-cycle
+    def _rebuild_topology(self):
+        """Build the device list and OID set from spec.json (no I/O)."""
         self.devices = []
-        self._oids_to_fetch = set()
+        self._oids_to_fetch = []
 
         # Build from spec (no discovery)
         for hk in self._spec.get("heating_circuits", []):
@@ -217,23 +320,43 @@ class WindhagerHttpClient:
         for mod in self._spec.get("modules", []):
             self._build_module_sensors(mod)
 
-        # Now look up all OIDs in one pass
-        ret = {"devices": self.devices, "oids": {}, "units": {}, "meta": {
-            "eco_default_duration_minutes": self._eco_default_duration_minutes
-        }}
+        # Insertion order, duplicates removed; fetch order carries no meaning
+        self._oids_ordered = tuple(dict.fromkeys(self._oids_to_fetch))
+        self._oid_index = {oid: i for i, oid in enumerate(self._oids_ordered)}
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("OIDs to fetch: %s", sorted(self._oids_ordered))
+
+    # ---------------------- Main entry for coordinator ----------------------
 
-        for oid in sorted(self._oids_to_fetch):
-            js = await self.fetch(oid)
-            if not js or "value" not in js:
-                ret["oids"][oid] = None
+    async def fetch_all(self):
+        """Fetch all OIDs referenced by the prebuilt device list concurrently."""
+        # Values and units are stored as lists parallel to self._oids_ordered
+        oids = self._oids_ordered
+        values = [None] * len(oids)
+        units = [None] * len(oids)
+        ret = {
+            "devices": self.devices,
+            # Mapping views over the lists for consumers that look up by OID
+            "oids": OIDView(self._oid_index, values, units),
+            "units": OIDMap(self._oid_index, units),
+        }
+
+        # Create the session once up-front so concurrent lookups don't race on it
+        await self._ensure_session()
+        results = await self._lookup_many(oids)
+
+        for i, (oid, js) in enumerate(zip(oids, results)):
+            if isinstance(js, Exception):
+                _LOGGER.error("Lookup failed for %s: %s", oid, js)
+                js = None
+            # Non-object bodies (strings, lists) carry no value
+            val = js.get("value", _MISSING) if isinstance(js, dict) else _MISSING
+            if val is _MISSING:
                 continue
-            val = js.get("value")
-            unit = js.get("unit")
-            ret["units"][oid] = unit
-            if val in self._unknown_values:
+            units[i] = js.get("unit")
+            if val is None or val in self._unknown_values:
                 _LOGGER.debug("Invalid or missing value for OID %s: %s", oid, js)
-                ret["oids"][oid] = None
             else:
-                ret["oids"][oid] = val
+                values[i] = val
 
-        return ret
\ No newline at end of file
+        return ret
@@ -6,6 +6,7 @@ Compatible with spec.json + new client.py
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any, Optional
 
 import voluptuous as vol
@@ -18,13 +19,13 @@ from homeassistant.components.climate import (
 )
 from homeassistant.components.climate.const import ATTR_TEMPERATURE
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, entity_platform
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN
+from .const import CONF_EXPOSE_NOBIAS_ENTITY, DOMAIN
 from .helpers import get_oid_value
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,6 +33,11 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_TEMP_STEP = 0.5
 FALLBACK_ECO_MINUTES = 180
 
+# Betriebsart raw <-> HA HVACMode; adjust once real values are confirmed
+_RAW_TO_MODE = {"0": HVACMode.AUTO, "2": HVACMode.OFF}
+_INT_TO_MODE = {0: HVACMode.AUTO, 2: HVACMode.OFF}
+_MODE_TO_RAW = {HVACMode.AUTO: "0", HVACMode.OFF: "2", HVACMode.HEAT: "1"}
+
 
 # ---------------------- Helper functions ---------------------- #
 
@@ -47,50 +53,22 @@ def _float_or_none(v: Any) -> Optional[float]:
 def map_mode_from_raw(raw: Any) -> HVACMode:
     """
     Betriebsart raw → HA HVACMode
-    Adjust mapping here once you confirm your real values.
+    Adjust mapping in _RAW_TO_MODE / _INT_TO_MODE once you confirm your real values.
     """
-    if str(raw) == "0":
-        return HVACMode.AUTO
-    if str(raw) == "2":
-        return HVACMode.OFF
-    return HVACMode.HEAT  # default
+    # Plain ints skip the str() conversion; everything else matches on its text
+    if type(raw) is int:
+        return _INT_TO_MODE.get(raw, HVACMode.HEAT)
+    return _RAW_TO_MODE.get(str(raw), HVACMode.HEAT)  # default HEAT
 
 
 def map_mode_to_raw(mode: HVACMode) -> str:
     """HA HVACMode → Betriebsart raw"""
-    if mode == HVACMode.AUTO:
-        return "0"
-    if mode == HVACMode.OFF:
-        return "2"
-    return "1"  # HEAT
+    return _MODE_TO_RAW.get(mode, "1")  # HEAT
 
 
 def _get_runtime_eco_minutes(coordinator) -> int:
-    """
-    Get default Eco/Comfort duration from:
-    1) httpClient.eco_default_duration_minutes
-    2) coordinator.data["meta"]
-    3) fallback
-    """
-    http = getattr(coordinator, "httpClient", None)
-    if http and hasattr(http, "eco_default_duration_minutes"):
-        try:
-            val = int(http.eco_default_duration_minutes)
-            if val > 0:
-                return val
-        except Exception:
-            pass
-
-    data = getattr(coordinator, "data", {}) or {}
-    meta = data.get("meta") or {}
-    try:
-        val = int(meta.get("eco_default_duration_minutes", FALLBACK_ECO_MINUTES))
-        if val > 0:
-            return val
-    except Exception:
-        pass
-
-    return FALLBACK_ECO_MINUTES
+    """Default Eco/Comfort duration from the HTTP client, or fallback."""
+    return coordinator.client.eco_default_duration_minutes or FALLBACK_ECO_MINUTES
 
 
 # ==============================================================
@@ -118,13 +96,16 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[ClimateEntity] = []
+    # The no-bias variant doubles the climate entities, so it is opt-in
+    expose_nobias = entry.options.get(CONF_EXPOSE_NOBIAS_ENTITY, False)
 
     for device in coordinator.data.get("devices", []):
         if device.get("type") == "climate":
             # standard entity
             entities.append(WindhagerClimate(coordinator, device))
             # no-bias version
-            entities.append(WindhagerClimateNoBias(coordinator, device))
+            if expose_nobias:
+                entities.append(WindhagerClimateNoBias(coordinator, device))
 
     if entities:
         async_add_entities(entities)
@@ -157,6 +138,10 @@ class WindhagerClimateBase(CoordinatorEntity, ClimateEntity):
         self._prefix = device.get("prefix", "")
         self._http = coordinator.httpClient
 
+        # Resolve OIDs once; properties read them on every state write
+        self._oid_room_temp = self._oids.get("room_temp")
+        self._oids_data = self._extract_oids_data(coordinator.data)
+
         dev_id = device.get("device_id") or device.get("id")
         name = device.get("device_name") or device.get("name") or "Windhager Climate"
 
@@ -170,17 +155,26 @@ class WindhagerClimateBase(CoordinatorEntity, ClimateEntity):
             model="MES Infinity (RC7030)",
         )
 
+    # ------------------ Coordinator data ------------------ #
+    @staticmethod
+    def _extract_oids_data(data: dict | None) -> Mapping:
+        return (data or {}).get("oids") or {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the OID values once per coordinator tick."""
+        self._oids_data = self._extract_oids_data(self.coordinator.data)
+        super()._handle_coordinator_update()
+
     # ------------------ Availability ------------------ #
     @property
     def available(self) -> bool:
-        o = (self.coordinator.data or {}).get("oids", {})
-        return o.get(self._oids.get("room_temp")) is not None
+        return self._oids_data.get(self._oid_room_temp) is not None
 
     # ------------------ Temperature getters ------------------ #
     @property
     def current_temperature(self) -> float | None:
-        oid = self._oids.get("room_temp")
-        return _float_or_none((self.coordinator.data or {}).get("oids", {}).get(oid))
+        return _float_or_none(self._oids_data.get(self._oid_room_temp))
 
     @property
     def target_temperature(self) -> float | None:
@@ -1,10 +1,12 @@
 """Constants for the Windhager Heater integration."""
 
 CLIMATE_FUNCTION_TYPE = 14
+CONF_EXPOSE_NOBIAS_ENTITY = "expose_nobias_entity"
 DEFAULT_USERNAME = "USER"
 DOMAIN = "windhager"
 HEATER_FUNCTION_TYPE = 9
 LOGWIN_FUNCTION_TYPE = 10
 AEROWIN_FUNCTION_TYPE = 7
 HYBRID_FUNCTION_TYPE = 26
+MAX_CONCURRENT_LOOKUPS = 4
 UPDATE_INTERVAL = 60
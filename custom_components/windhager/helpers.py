@@ -2,11 +2,55 @@
 
 from __future__ import annotations
 import logging
+from collections.abc import Iterator, Mapping
 from typing import Any, Optional
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class OIDMap(Mapping):
+    """Read-only OID -> item mapping over a list parallel to the fetched OIDs."""
+
+    __slots__ = ("_index", "_items")
+
+    def __init__(self, index: dict[str, int], items: list) -> None:
+        self._index = index
+        self._items = items
+
+    def get(self, oid: str | None, default: Any = None) -> Any | None:
+        """Return the item for an OID, or default if it is not fetched."""
+        i = self._index.get(oid)
+        return default if i is None else self._items[i]
+
+    def __getitem__(self, oid: str) -> Any | None:
+        return self._items[self._index[oid]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class OIDView(OIDMap):
+    """OID -> value mapping that can also return the unit of each OID."""
+
+    __slots__ = ("_units",)
+
+    def __init__(self, index: dict[str, int], values: list, units: list) -> None:
+        super().__init__(index, values)
+        self._units = units
+
+    def value(self, oid: str | None, default: Any = None) -> Any | None:
+        """Return the value for an OID, or default if it is not fetched."""
+        return self.get(oid, default)
+
+    def unit(self, oid: str | None, default: Any = None) -> Any | None:
+        """Return the unit for an OID, or default if it is not fetched."""
+        i = self._index.get(oid)
+        return default if i is None else self._units[i]
+
+
 def parse_value(
     value: Any, as_type: type = float, oid: str | None = None
 ) -> Any | None: